@@ -0,0 +1,118 @@
+"""Pre-rendered animation blocks
+
+Effects that are pure functions of time and position can be evaluated a
+block of frames at a time instead of one LED at a time:
+
+    def ripple(t, x, y):
+        # t: (T, 1, 1) seconds, x and y: (1, H, W) matrix coordinates.
+        return np.sin(t + x + y)[..., np.newaxis] * 127 + 128
+
+The effect returns a (T, H, W, 3) block, or anything that broadcasts to
+it, in the same BGR channel order as LEDStrip. AnimationPlayer streams
+each block through an LEDStrip while the next one is evaluated on a
+worker thread.
+"""
+from __future__ import annotations
+
+import time
+from itertools import islice
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+import numpy as np
+
+from .pixel_map import PixelMap
+
+if TYPE_CHECKING:
+    from .mock import LEDStrip
+
+Effect = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+
+def evaluate(
+        effect: Effect,
+        layout: PixelMap,
+        times: np.ndarray) -> np.ndarray:
+    """Evaluate an effect at every time, as a (T, H, W, 3) uint8 block."""
+    times = np.asarray(times, dtype="float64")
+    y, x = np.indices((layout.height, layout.width))
+    block = effect(
+        times[:, np.newaxis, np.newaxis],
+        x[np.newaxis],
+        y[np.newaxis],
+    )
+    shape = (times.size, layout.height, layout.width, 3)
+    block = np.broadcast_to(np.asarray(block), shape)
+    return np.clip(block, 0, 255).astype("uint8")
+
+
+def to_strip_order(block: np.ndarray, layout: PixelMap) -> np.ndarray:
+    """Reorder a (T, H, W, 3) block into (T, LEDs, 3) strip order."""
+    x, y = layout.coordinate_table
+    return block[:, y, x]
+
+
+class AnimationPlayer:
+
+    def __init__(
+            self,
+            strip: LEDStrip,
+            layout: PixelMap,
+            effect: Effect,
+            fps: float = 30.0,
+            block_seconds: float = 1.0) -> None:
+        self._strip = strip
+        self._layout = layout
+        self._effect = effect
+        self._fps = fps
+        self._block_size = max(1, round(block_seconds * fps))
+
+    def blocks(self, start: float = 0.0) -> Iterator[np.ndarray]:
+        """Yield (T, LEDs, 3) blocks, evaluating each one ahead of time."""
+        first_frame = round(start * self._fps)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = self._submit(executor, first_frame)
+            while True:
+                block = pending.result()
+                first_frame += self._block_size
+                pending = self._submit(executor, first_frame)
+                yield block
+
+    def frames(self, start: float = 0.0) -> Iterator[np.ndarray]:
+        for block in self.blocks(start):
+            yield from block
+
+    def play(
+            self,
+            duration: Optional[float] = None,
+            start: float = 0.0,
+            realtime: bool = True) -> int:
+        """Show frames for `duration` seconds, or forever if it's None.
+
+        Returns the number of frames shown.
+        """
+        total = None if duration is None else round(duration * self._fps)
+        period = 1.0 / self._fps
+        deadline = time.perf_counter()
+        shown = 0
+        for frame in islice(self.frames(start), total):
+            self._strip.buffer[:len(frame)] = frame
+            self._strip.show()
+            shown += 1
+            if realtime:
+                deadline += period
+                delay = deadline - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        return shown
+
+    def _submit(
+            self,
+            executor: ThreadPoolExecutor,
+            first_frame: int) -> Future:
+        frame_numbers = np.arange(first_frame, first_frame + self._block_size)
+        return executor.submit(self._render, frame_numbers / self._fps)
+
+    def _render(self, times: np.ndarray) -> np.ndarray:
+        block = evaluate(self._effect, self._layout, times)
+        return to_strip_order(block, self._layout)
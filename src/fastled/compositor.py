@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import zlib
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from .crgb import CRGB
+
+if TYPE_CHECKING:
+    from .mock import LEDStrip
+
+
+class BlendMode(Enum):
+    NORMAL = "normal"
+    ADD = "add"
+    SCREEN = "screen"
+    MULTIPLY = "multiply"
+    MAX = "max"
+
+
+def _blend(mode: BlendMode, base: np.ndarray, top: np.ndarray) -> np.ndarray:
+    if mode is BlendMode.NORMAL:
+        return top
+    if mode is BlendMode.ADD:
+        return np.minimum(base + top, 1.0)
+    if mode is BlendMode.SCREEN:
+        return 1.0 - ((1.0 - base) * (1.0 - top))
+    if mode is BlendMode.MULTIPLY:
+        return base * top
+    if mode is BlendMode.MAX:
+        return np.maximum(base, top)
+    raise NotImplementedError(f"Unknown blend mode '{mode}'")
+
+
+class Layer:
+
+    def __init__(
+            self,
+            length: int,
+            opacity: float = 1.0,
+            blend: BlendMode = BlendMode.NORMAL,
+            mask: Optional[np.ndarray] = None,
+            visible: bool = True) -> None:
+        self._buffer = np.zeros((length, 3), dtype="uint8")
+        self._opacity = opacity
+        self._blend = BlendMode(blend)
+        self._mask = self._as_mask(mask)
+        self._visible = visible
+        self._changed = True
+        self._digest: Optional[int] = None
+
+    @property
+    def buffer(self) -> np.ndarray:
+        return self._buffer
+
+    @property
+    def opacity(self) -> float:
+        return self._opacity
+
+    @opacity.setter
+    def opacity(self, value: float) -> None:
+        self._opacity = value
+        self._changed = True
+
+    @property
+    def blend(self) -> BlendMode:
+        return self._blend
+
+    @blend.setter
+    def blend(self, value: BlendMode) -> None:
+        self._blend = BlendMode(value)
+        self._changed = True
+
+    @property
+    def mask(self) -> Optional[np.ndarray]:
+        return self._mask
+
+    @mask.setter
+    def mask(self, value: Optional[np.ndarray]) -> None:
+        self._mask = self._as_mask(value)
+        self._changed = True
+
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        self._visible = value
+        self._changed = True
+
+    def touch(self) -> None:
+        self._changed = True
+
+    def fill(self, colour: CRGB) -> None:
+        self._buffer[:] = colour[:]
+        self._changed = True
+
+    def clear(self) -> None:
+        self._buffer[:] = 0
+        self._changed = True
+
+    def __setitem__(self, key: int, value: CRGB) -> None:
+        if isinstance(key, int):
+            self._buffer[key] = value[:]
+            self._changed = True
+            return
+        raise NotImplementedError(f"Unknown key '{key}'")
+
+    def _check_changed(self) -> bool:
+        # Writes through a kept reference to the buffer can't be seen, so
+        # compare a digest of its contents with the last flattened one.
+        digest = zlib.crc32(memoryview(self._buffer))
+        if digest != self._digest:
+            self._digest = digest
+            self._changed = True
+        return self._changed
+
+    def _as_mask(self, mask: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if mask is None:
+            return None
+        mask = np.asarray(mask)
+        if mask.shape != self._buffer.shape[:1]:
+            raise ValueError(
+                f"Mask shape {mask.shape} should be {self._buffer.shape[:1]}")
+        if np.issubdtype(mask.dtype, np.integer):
+            return mask.astype("float32") / 255
+        return mask.astype("float32")
+
+    def _apply(self, base: np.ndarray) -> np.ndarray:
+        top = self._buffer.astype("float32") / 255
+        blended = _blend(self._blend, base, top)
+        alpha = self._opacity
+        if self._mask is not None:
+            alpha = alpha * self._mask[:, np.newaxis]
+        if np.isscalar(alpha) and alpha == 1.0:
+            return blended
+        return base + ((blended - base) * alpha)
+
+
+class Compositor:
+    """Stacks named layers and flattens them into an LEDStrip.
+
+    Layers are blended bottom to top in the order they were added. The
+    result after each layer is kept, so flattening restarts from the
+    lowest layer that changed and does nothing if none did.
+    """
+
+    def __init__(self, strip: LEDStrip) -> None:
+        self._strip = strip
+        self._length = len(strip.buffer)
+        self._layers: Dict[str, Layer] = {}
+        self._partials: List[np.ndarray] = []
+        self._dirty_from = 0
+
+    def add_layer(self, name: str, **kwargs: Any) -> Layer:
+        if name in self._layers:
+            raise KeyError(f"Layer '{name}' already exists")
+        self._layers[name] = Layer(self._length, **kwargs)
+        return self._layers[name]
+
+    def remove_layer(self, name: str) -> None:
+        if name not in self._layers:
+            raise KeyError(f"Layer '{name}' does not exist")
+        position = list(self._layers).index(name)
+        del self._layers[name]
+        self._invalidate(position)
+
+    def __getitem__(self, name: str) -> Layer:
+        return self._layers[name]
+
+    def __iter__(self) -> Iterator[Layer]:
+        return iter(self._layers.values())
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def flatten(self) -> bool:
+        layers = list(self._layers.values())
+        changed = [
+            i for i, layer in enumerate(layers) if layer._check_changed()
+        ]
+        start = min([self._dirty_from] + changed + [len(layers)])
+        if start == len(layers) and start == len(self._partials):
+            return False
+
+        del self._partials[start:]
+        result = self._partials[-1] if self._partials else np.zeros(
+            (self._length, 3), dtype="float32")
+        for layer in layers[start:]:
+            if layer._visible:
+                result = layer._apply(result)
+            layer._changed = False
+            self._partials.append(result)
+        self._dirty_from = len(layers)
+
+        self._strip.buffer[:] = np.rint(result * 255).astype("uint8")
+        return True
+
+    def show(self) -> None:
+        self.flatten()
+        self._strip.show()
+
+    def _invalidate(self, position: int) -> None:
+        self._dirty_from = min(self._dirty_from, position)
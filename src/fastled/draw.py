@@ -0,0 +1,176 @@
+"""Vectorized drawing in matrix coordinates
+
+The shape functions rasterize into (x, y) coordinate arrays with NumPy.
+Canvas clips them to the layout, looks up every LED index at once in the
+layout's index table and writes the colour with a single scatter. LEDs
+past the end of a strip shorter than the layout are left out.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .crgb import CRGB
+from .pixel_map import PixelMap
+
+if TYPE_CHECKING:
+    from .mock import LEDStrip
+
+Points = Tuple[np.ndarray, np.ndarray]
+Colour = Union[CRGB, int]
+
+
+def as_pixel(colour: Colour) -> np.ndarray:
+    """A CRGB or 0xRRGGBB colour as a uint8 pixel in the strip's order."""
+    if not isinstance(colour, CRGB):
+        colour = CRGB(int(colour))
+    return np.array(colour[:], dtype="uint8")
+
+
+def _grid(x0: int, y0: int, x1: int, y1: int) -> Points:
+    y, x = np.mgrid[y0:y1 + 1, x0:x1 + 1]
+    return x.ravel(), y.ravel()
+
+
+def line(x0: int, y0: int, x1: int, y1: int) -> Points:
+    steps = max(abs(x1 - x0), abs(y1 - y0))
+    t = np.linspace(0.0, 1.0, steps + 1)
+    x = np.rint(x0 + (t * (x1 - x0))).astype("intp")
+    y = np.rint(y0 + (t * (y1 - y0))).astype("intp")
+    return x, y
+
+
+def rect(x: int, y: int, width: int, height: int,
+         fill: bool = True) -> Points:
+    if width < 1 or height < 1:
+        return np.empty(0, dtype="intp"), np.empty(0, dtype="intp")
+    gx, gy = _grid(x, y, x + width - 1, y + height - 1)
+    if fill:
+        return gx, gy
+    edge = ((gx == x) | (gx == x + width - 1)
+            | (gy == y) | (gy == y + height - 1))
+    return gx[edge], gy[edge]
+
+
+def circle(cx: int, cy: int, radius: float, fill: bool = True) -> Points:
+    r = int(np.ceil(radius))
+    x, y = _grid(cx - r, cy - r, cx + r, cy + r)
+    distance = np.hypot(x - cx, y - cy)
+    inside = distance <= radius
+    if not fill:
+        inside &= distance > radius - 1
+    return x[inside], y[inside]
+
+
+def polygon(points: Sequence[Tuple[int, int]], fill: bool = True) -> Points:
+    vertices = np.asarray(points, dtype="intp").reshape(-1, 2)
+    ends = np.roll(vertices, -1, axis=0)
+    edges = [line(*start, *end) for start, end in zip(vertices, ends)]
+    x = np.concatenate([edge[0] for edge in edges])
+    y = np.concatenate([edge[1] for edge in edges])
+    if not fill:
+        return x, y
+
+    # Even-odd test of every pixel centre in the bounding box against
+    # every edge at once.
+    (left, top), (right, bottom) = vertices.min(0), vertices.max(0)
+    gx, gy = _grid(left, top, right, bottom)
+    px, py = gx[:, np.newaxis], gy[:, np.newaxis]
+    (x0, y0), (x1, y1) = vertices.T, ends.T
+    crosses = (y0 > py) != (y1 > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x0 + ((py - y0) * (x1 - x0) / (y1 - y0))
+    inside = np.logical_xor.reduce(crosses & (px < x_cross), axis=1)
+    return np.concatenate([x, gx[inside]]), np.concatenate([y, gy[inside]])
+
+
+class Canvas:
+
+    def __init__(self, strip: LEDStrip, layout: PixelMap) -> None:
+        self._strip = strip
+        self._layout = layout
+
+    @property
+    def layout(self) -> PixelMap:
+        return self._layout
+
+    def indices(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """LED indices of the given coordinates that fall on the strip."""
+        x, y = np.asarray(x), np.asarray(y)
+        visible = ((x >= 0) & (x < self._layout.width)
+                   & (y >= 0) & (y < self._layout.height))
+        index = self._layout.index_table[y[visible], x[visible]]
+        return index[index < len(self._strip.buffer)]
+
+    def plot(self, x: np.ndarray, y: np.ndarray, colour: Colour) -> None:
+        self._strip.buffer[self.indices(x, y)] = as_pixel(colour)
+
+    def blit(self, image: np.ndarray, x: int = 0, y: int = 0,
+             mask: Optional[np.ndarray] = None) -> None:
+        """Copy an (h, w, 3) image onto the layout with its top-left at (x, y).
+
+        Only pixels where `mask` is set are copied, if a mask is given.
+        """
+        height, width = image.shape[:2]
+        left, top = max(x, 0), max(y, 0)
+        right = min(x + width, self._layout.width)
+        bottom = min(y + height, self._layout.height)
+        if left >= right or top >= bottom:
+            return
+
+        visible = (slice(top - y, bottom - y), slice(left - x, right - x))
+        index = self._layout.index_table[top:bottom, left:right]
+        image = image[visible]
+        keep = index < len(self._strip.buffer)
+        if mask is not None:
+            keep &= mask[visible].astype(bool)
+        self._strip.buffer[index[keep]] = image[keep]
+
+    def line(self, x0: int, y0: int, x1: int, y1: int,
+             colour: Colour) -> None:
+        self.plot(*line(x0, y0, x1, y1), colour)
+
+    def rect(self, x: int, y: int, width: int, height: int,
+             colour: Colour, fill: bool = True) -> None:
+        self.plot(*rect(x, y, width, height, fill), colour)
+
+    def circle(self, cx: int, cy: int, radius: float,
+               colour: Colour, fill: bool = True) -> None:
+        self.plot(*circle(cx, cy, radius, fill), colour)
+
+    def polygon(self, points: Sequence[Tuple[int, int]],
+                colour: Colour, fill: bool = True) -> None:
+        self.plot(*polygon(points, fill), colour)
+
+    def points(self, x: np.ndarray, y: np.ndarray, colour: Colour) -> None:
+        """Draw anti-aliased points at fractional coordinates.
+
+        Each point is spread over its four neighbouring LEDs with bilinear
+        weights and blended over what is already there.
+        """
+        x = np.atleast_1d(np.asarray(x, dtype="float64"))
+        y = np.atleast_1d(np.asarray(y, dtype="float64"))
+        x0, y0 = np.floor(x), np.floor(y)
+        fx, fy = x - x0, y - y0
+        nx = np.concatenate([x0, x0 + 1, x0, x0 + 1]).astype("intp")
+        ny = np.concatenate([y0, y0, y0 + 1, y0 + 1]).astype("intp")
+        weight = np.concatenate([
+            (1 - fx) * (1 - fy), fx * (1 - fy), (1 - fx) * fy, fx * fy,
+        ])
+
+        visible = ((nx >= 0) & (nx < self._layout.width)
+                   & (ny >= 0) & (ny < self._layout.height)
+                   & (weight > 0))
+        index = self._layout.index_table[ny[visible], nx[visible]]
+        weight = weight[visible]
+        on_strip = index < len(self._strip.buffer)
+        # Points that share an LED add up their coverage.
+        coverage = np.zeros(len(self._strip.buffer))
+        np.add.at(coverage, index[on_strip], weight[on_strip])
+        touched = np.flatnonzero(coverage)
+        alpha = np.minimum(coverage[touched], 1.0)[:, np.newaxis]
+
+        current = self._strip.buffer[touched].astype("float64")
+        blended = current + ((as_pixel(colour) - current) * alpha)
+        self._strip.buffer[touched] = np.rint(blended).astype("uint8")
@@ -0,0 +1,178 @@
+"""Image and video ingest
+
+Frames come from a video, image files or raw arrays as a generator, are
+shrunk to the layout's resolution (or sampled at given LED positions) and
+written into an LEDStrip through the layout's coordinate table:
+
+    frames = video_frames("clip.mp4")
+    for _ in ingest(frames, leds, layout):
+        leds.show()
+
+Frames are expected in OpenCV's BGR channel order, which is also the
+order LEDStrip stores its colours in. OpenCV is only imported for the
+video and image sources.
+"""
+from __future__ import annotations
+
+import threading
+from queue import Queue
+from typing import (
+    TYPE_CHECKING, Any, Iterable, Iterator, Optional, Tuple, Union
+)
+
+import numpy as np
+
+from .pixel_map import PixelMap
+
+if TYPE_CHECKING:
+    from .mock import LEDStrip
+
+_DONE = object()
+
+
+def video_frames(source: Union[str, int]) -> Iterator[np.ndarray]:
+    """Decode frames from a video file, stream URL or camera index."""
+    import cv2
+
+    capture = cv2.VideoCapture(source)
+    if not capture.isOpened():
+        raise IOError(f"Unable to open video source '{source}'")
+    try:
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                return
+            yield frame
+    finally:
+        capture.release()
+
+
+def image_frames(paths: Iterable[str]) -> Iterator[np.ndarray]:
+    import cv2
+
+    for path in paths:
+        frame = cv2.imread(str(path), cv2.IMREAD_COLOR)
+        if frame is None:
+            raise FileNotFoundError(f"Unable to read image '{path}'")
+        yield frame
+
+
+def prefetch(frames: Iterable[Any], depth: int = 4) -> Iterator[Any]:
+    """Pull from `frames` on a worker thread, up to `depth` items ahead.
+
+    Exceptions raised by the source are re-raised in the consumer.
+    """
+    queue: Queue = Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def worker() -> None:
+        try:
+            for frame in frames:
+                if stop.is_set():
+                    return
+                queue.put(frame)
+        except BaseException as error:
+            queue.put(error)
+        queue.put(_DONE)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # Unblock the worker if it is waiting on a full queue.
+        while thread.is_alive():
+            while not queue.empty():
+                queue.get_nowait()
+            thread.join(timeout=0.01)
+
+
+def _as_bgr(frame: np.ndarray) -> np.ndarray:
+    frame = np.asarray(frame)
+    if frame.ndim == 2:
+        frame = frame[..., np.newaxis]
+    if frame.shape[-1] == 1:
+        return np.repeat(frame, 3, axis=-1)
+    return frame[..., :3]
+
+
+def _shrink_axis(frame: np.ndarray, size: int, axis: int) -> np.ndarray:
+    length = frame.shape[axis]
+    if size >= length:
+        # Nothing to average, so repeat the nearest pixels instead.
+        nearest = (np.arange(size) * length) // size
+        return np.take(frame, nearest, axis=axis)
+    edges = np.linspace(0, length, size + 1).astype("intp")
+    sums = np.add.reduceat(frame, edges[:-1], axis=axis)
+    counts = np.diff(edges).reshape(
+        [-1 if i == axis else 1 for i in range(frame.ndim)])
+    return sums / counts
+
+
+def downsample(frame: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Area-average a frame down to (height, width, 3) uint8."""
+    frame = _as_bgr(frame).astype("float32")
+    frame = _shrink_axis(frame, height, axis=0)
+    frame = _shrink_axis(frame, width, axis=1)
+    return np.clip(np.rint(frame), 0, 255).astype("uint8")
+
+
+def sample(frame: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Sample the nearest pixels at normalised (0 to 1) coordinates."""
+    frame = _as_bgr(frame)
+    height, width = frame.shape[:2]
+    columns = np.rint(np.asarray(x) * (width - 1)).astype("intp")
+    rows = np.rint(np.asarray(y) * (height - 1)).astype("intp")
+    columns = np.clip(columns, 0, width - 1)
+    rows = np.clip(rows, 0, height - 1)
+    return frame[rows, columns]
+
+
+def write_frame(
+        strip: LEDStrip,
+        layout: PixelMap,
+        image: np.ndarray) -> None:
+    """Write a (height, width, 3) image at layout resolution into a strip."""
+    x, y = layout.coordinate_table
+    count = min(len(strip.buffer), x.size)
+    strip.buffer[:count] = image[y[:count], x[:count]]
+
+
+def ingest(
+        frames: Iterable[np.ndarray],
+        strip: LEDStrip,
+        layout: PixelMap,
+        depth: int = 4,
+        coordinates: Optional[Tuple[np.ndarray, np.ndarray]] = None
+) -> Iterator[int]:
+    """Write each frame into the strip, yielding its frame number.
+
+    Frames are area-averaged to the layout, or, if `coordinates` gives
+    normalised (x, y) positions for each LED in strip order, sampled at
+    those positions instead. Decoding and resizing happen on a
+    prefetching worker thread, so the caller only has to show the strip
+    and keep time.
+    """
+    if coordinates is None:
+        images = (
+            downsample(frame, layout.width, layout.height)
+            for frame in frames
+        )
+        for number, image in enumerate(prefetch(images, depth)):
+            write_frame(strip, layout, image)
+            yield number
+        return
+
+    x, y = coordinates
+    samples = (sample(frame, x, y) for frame in frames)
+    for number, pixels in enumerate(prefetch(samples, depth)):
+        count = min(len(strip.buffer), len(pixels))
+        strip.buffer[:count] = pixels[:count]
+        yield number
@@ -1,2 +1,17 @@
-from .display import LEDWindow
+from typing import Any
+
+from .headless import HeadlessWindow
 from .led import LEDStrip
+from .shared import SharedLEDStrip
+
+
+def __getattr__(name: str) -> Any:
+    # LEDWindow needs OpenCV, which is slow to import, so only load the
+    # display backend when it is asked for.
+    if name == "LEDWindow":
+        from .display import LEDWindow
+        return LEDWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["HeadlessWindow", "LEDStrip", "LEDWindow", "SharedLEDStrip"]
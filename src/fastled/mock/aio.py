@@ -0,0 +1,83 @@
+"""asyncio helpers for driving LED strips
+
+    clock = FrameClock(fps=30)
+    async for frame in clock:
+        draw(leds, frame)
+        await leds.show_async()
+
+Several fixtures can share one event loop, either as separate tasks with
+their own clocks or by showing them together with show_all().
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from typing import AsyncIterator, Callable, Optional
+
+from .led import LEDStrip
+
+
+class FrameClock:
+    """Ticks at a fixed rate without drifting.
+
+    Each tick is scheduled from the start time rather than from the last
+    tick, so time spent drawing doesn't accumulate. If a caller falls more
+    than a frame behind, the missed frames are skipped. Time is read from
+    the event loop unless another `clock` is given.
+    """
+
+    def __init__(
+            self,
+            fps: float,
+            clock: Optional[Callable[[], float]] = None) -> None:
+        self._period = 1.0 / fps
+        self._clock = clock
+        self._start: Optional[float] = None
+        self._frame = -1
+        self._dropped = 0
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def reset(self) -> None:
+        self._start = None
+        self._frame = -1
+        self._dropped = 0
+
+    async def tick(self) -> int:
+        """Wait for the next frame and return its number."""
+        clock = self._clock or asyncio.get_running_loop().time
+        now = clock()
+        if self._start is None:
+            self._start = now
+            self._frame = 0
+            return self._frame
+
+        due = int((now - self._start) / self._period)
+        if due > self._frame + 1:
+            self._dropped += due - self._frame - 1
+            self._frame = due
+        else:
+            self._frame += 1
+        deadline = self._start + (self._frame * self._period)
+        await asyncio.sleep(max(0.0, deadline - now))
+        return self._frame
+
+    def __aiter__(self) -> AsyncIterator[int]:
+        return self._ticks()
+
+    async def _ticks(self) -> AsyncIterator[int]:
+        while True:
+            yield await self.tick()
+
+
+async def show_all(
+        *strips: LEDStrip,
+        executor: Optional[Executor] = None) -> None:
+    """Show several strips at once, returning when they have all shown."""
+    await asyncio.gather(*(strip.show_async(executor) for strip in strips))
@@ -0,0 +1,184 @@
+"""Offline batch renderer
+
+Renders (effect, layout, size, frame count) jobs headlessly across a
+process pool and saves each animation as a (frames, height, width, 3)
+uint8 array in a .npy file.
+
+Effects are called once per frame as effect(leds, layout, frame) and
+should only draw; the renderer calls leds.show(). They must be importable
+by the worker processes, so pass a module-level function or a
+"package.module:function" reference.
+
+From the command line, jobs are read from a JSON list of objects with the
+same fields as RenderJob, with the layout given by class name:
+
+    python -m fastled.mock.batch jobs.json --output renders --processes 8
+
+A job that raises doesn't stop the others; its result has no path and
+holds the error instead, and the command exits with status 1.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Callable, Iterable, List, NamedTuple, Optional, Sequence, Type, Union
+)
+
+import numpy as np
+
+from .. import pixel_map
+from .headless import HeadlessWindow
+from .led import LEDStrip
+
+Effect = Callable[[LEDStrip, pixel_map.PixelMap, int], None]
+
+
+class RenderJob(NamedTuple):
+    effect: Union[Effect, str]
+    map_type: Union[Type[pixel_map.PixelMap], str]
+    width: int
+    height: int
+    frames: int
+    name: Optional[str] = None
+
+
+class RenderResult(NamedTuple):
+    name: str
+    path: Optional[Path]
+    frames: int
+    seconds: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.seconds if self.seconds else float("inf")
+
+
+def _resolve_effect(effect: Union[Effect, str]) -> Effect:
+    if callable(effect):
+        return effect
+    module_name, _, attribute = effect.partition(":")
+    if not attribute:
+        raise ValueError(
+            f"Effect '{effect}' should look like 'package.module:function'")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def _resolve_map_type(
+        map_type: Union[Type[pixel_map.PixelMap], str]
+) -> Type[pixel_map.PixelMap]:
+    if isinstance(map_type, str):
+        return getattr(pixel_map, map_type)
+    return map_type
+
+
+def _job_name(job: RenderJob) -> str:
+    if job.name:
+        return job.name
+    effect = job.effect if isinstance(job.effect, str) else (
+        f"{job.effect.__module__}:{job.effect.__qualname__}")
+    map_type = _resolve_map_type(job.map_type).__name__
+    name = f"{effect}-{map_type}-{job.width}x{job.height}-{job.frames}"
+    return name.replace(":", ".")
+
+
+def render(job: RenderJob) -> np.ndarray:
+    effect = _resolve_effect(job.effect)
+    map_type = _resolve_map_type(job.map_type)
+    window = HeadlessWindow(job.width, job.height, map_type)
+    layout = map_type(job.width, job.height)
+    leds = LEDStrip(job.width * job.height, window)
+    for frame in range(job.frames):
+        effect(leds, layout, frame)
+        leds.show()
+    if not window.frames:
+        return np.empty((0, job.height, job.width, 3), dtype="uint8")
+    return np.stack(window.frames)
+
+
+def render_to_file(job: RenderJob, output_dir: Path) -> RenderResult:
+    name = _job_name(job)
+    start = time.perf_counter()
+    frames = render(job)
+    seconds = time.perf_counter() - start
+    path = Path(output_dir) / f"{name}.npy"
+    np.save(path, frames)
+    return RenderResult(name, path, job.frames, seconds)
+
+
+def render_batch(
+        jobs: Iterable[RenderJob],
+        output_dir: Union[str, Path],
+        processes: Optional[int] = None) -> List[RenderResult]:
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = list(jobs)
+    names = Counter(_job_name(job) for job in jobs)
+    duplicates = sorted(name for name, count in names.items() if count > 1)
+    if duplicates:
+        raise ValueError(
+            f"Jobs would overwrite each other's output: {duplicates}")
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(render_to_file, job, output_dir) for job in jobs
+        ]
+        results = []
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as error:
+                results.append(RenderResult(
+                    _job_name(job), None, 0, 0.0,
+                    f"{type(error).__name__}: {error}"))
+        return results
+
+
+def load_jobs(path: Union[str, Path]) -> List[RenderJob]:
+    with open(path) as jobs_file:
+        return [RenderJob(**job) for job in json.load(jobs_file)]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m fastled.mock.batch",
+        description="Render animations offline across a process pool.")
+    parser.add_argument("jobs", help="JSON file listing the render jobs")
+    parser.add_argument("-o", "--output", default="renders",
+                        help="directory to write .npy renders to")
+    parser.add_argument("-p", "--processes", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    jobs = load_jobs(args.jobs)
+    start = time.perf_counter()
+    results = render_batch(jobs, args.output, args.processes)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if result.ok:
+            print(f"OK   {result.name}: {result.frames} frames in "
+                  f"{result.seconds:.3f}s ({result.fps:.1f} fps)")
+        else:
+            print(f"FAIL {result.name}: {result.error}")
+    failed = sum(not result.ok for result in results)
+    total = sum(result.frames for result in results)
+    print(f"Rendered {len(results) - failed} of {len(results)} jobs, "
+          f"{total} frames in {elapsed:.3f}s "
+          f"using {args.processes or os.cpu_count()} processes")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
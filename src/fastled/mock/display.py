@@ -79,6 +79,10 @@ class LEDWindow:
         x, y = self._map.get_coordinates(index)
         self._draw_led(x, y, tuple(pixel_value.tolist()))
 
+    def set_leds(self, pixel_values: np.ndarray) -> None:
+        for i, pixel_value in enumerate(pixel_values):
+            self.set_led(i, pixel_value)
+
     def _draw_led(self, x: int, y: int, colour: Tuple[int]) -> None:
         x_pos = self._spacing.center(x)
         y_pos = self._spacing.center(y)
@@ -0,0 +1,113 @@
+"""Golden-frame regression checks
+
+An animation is run headlessly through an LEDStrip and every shown buffer
+is hashed with CRC-32 straight from its memory. The digests are compared
+with a stored golden sequence, so an unchanged animation costs one hash
+per frame. The golden file also keeps the frames themselves, which are
+only read to report the first differing pixel on a mismatch.
+
+    check_golden(effect, layout, 100, "tests/golden/chase.npz")
+
+The golden file is written if it doesn't exist yet, or when update=True.
+"""
+from __future__ import annotations
+
+import zlib
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from ..pixel_map import PixelMap
+from .batch import Effect
+from .headless import HeadlessWindow
+from .led import LEDStrip
+
+
+class Mismatch(NamedTuple):
+    frame: int
+    index: int
+    coordinates: Tuple[int, int]
+    expected: np.ndarray
+    actual: np.ndarray
+
+    def __str__(self) -> str:
+        x, y = self.coordinates
+        return (f"Frame {self.frame} differs first at LED {self.index} "
+                f"(x={x}, y={y}): expected {self.expected.tolist()}, "
+                f"got {self.actual.tolist()}")
+
+
+def frame_digest(buffer: np.ndarray) -> int:
+    return zlib.crc32(memoryview(np.ascontiguousarray(buffer)))
+
+
+def run(
+        effect: Effect,
+        layout: PixelMap,
+        frames: int) -> Iterator[np.ndarray]:
+    """Yield the strip buffer after each shown frame.
+
+    The same buffer is yielded every time, so copy it to keep it.
+    """
+    window = HeadlessWindow(
+        layout.width, layout.height, type(layout), record=False)
+    leds = LEDStrip(layout.width * layout.height, window)
+    for frame in range(frames):
+        effect(leds, layout, frame)
+        leds.show()
+        yield leds.buffer
+
+
+def record(
+        effect: Effect,
+        layout: PixelMap,
+        frames: int,
+        path: Union[str, Path]) -> np.ndarray:
+    buffers = np.stack(
+        [buffer.copy() for buffer in run(effect, layout, frames)])
+    digests = np.array([frame_digest(buffer) for buffer in buffers],
+                       dtype="uint32")
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(path, digests=digests, frames=buffers)
+    return digests
+
+
+def compare(
+        effect: Effect,
+        layout: PixelMap,
+        frames: int,
+        path: Union[str, Path]) -> Optional[Mismatch]:
+    """Return the first difference from the golden file, if any."""
+    with np.load(path) as golden:
+        digests = golden["digests"]
+        if len(digests) != frames:
+            raise ValueError(
+                f"{path} holds {len(digests)} frames, not {frames}")
+
+        for frame, buffer in enumerate(run(effect, layout, frames)):
+            if frame_digest(buffer) == digests[frame]:
+                continue
+            expected = golden["frames"][frame]
+            differs = np.flatnonzero((expected != buffer).any(axis=-1))
+            # A digest can't differ without a pixel differing, but
+            # report the frame even if the stored frames were edited.
+            index = int(differs[0]) if differs.size else 0
+            return Mismatch(frame, index, layout.get_coordinates(index),
+                            expected[index], buffer[index].copy())
+    return None
+
+
+def check_golden(
+        effect: Effect,
+        layout: PixelMap,
+        frames: int,
+        path: Union[str, Path],
+        update: bool = False) -> None:
+    """Raise AssertionError if the animation no longer matches `path`."""
+    if update or not Path(path).exists():
+        record(effect, layout, frames, path)
+        return
+    mismatch = compare(effect, layout, frames, path)
+    if mismatch is not None:
+        raise AssertionError(str(mismatch))
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import List, Type
+
+import numpy as np
+
+from .. import pixel_map
+
+
+class HeadlessWindow:
+    """A stand-in for LEDWindow that keeps frames instead of drawing them.
+
+    Each frame is a (height, width, 3) image with one pixel per LED, laid
+    out in matrix coordinates, so it can be saved or compared directly.
+    """
+
+    def __init__(
+            self,
+            width: int = 1,
+            height: int = 1,
+            map_type: Type[pixel_map.PixelMap]
+            = pixel_map.TopLeftProgressiveRows,
+            record: bool = True) -> None:
+        self._map = map_type(width, height)
+        self._record = record
+        self._frame = np.zeros((height, width, 3), dtype="uint8")
+        self.frames: List[np.ndarray] = []
+
+    @property
+    def frame(self) -> np.ndarray:
+        return self._frame
+
+    def show(self) -> None:
+        if self._record:
+            self.frames.append(self._frame.copy())
+
+    def clear(self) -> None:
+        self._frame[:] = 0
+
+    def set_led(self, index: int, pixel_value: np.ndarray) -> None:
+        x, y = self._map.get_coordinates(index)
+        self._frame[y, x] = pixel_value
+
+    def set_leds(self, pixel_values: np.ndarray) -> None:
+        x, y = self._map.coordinate_table
+        count = min(len(pixel_values), x.size)
+        self._frame[y[:count], x[:count]] = pixel_values[:count]
@@ -1,9 +1,15 @@
-from typing import Iterator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
 import numpy as np
 
 from ..crgb import CRGB
-from .display import LEDWindow
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, ThreadPoolExecutor
+
+    from .display import LEDWindow
 
 
 class _LEDRef:
@@ -23,11 +29,47 @@ class LEDStrip:
             window: LEDWindow) -> None:
         self._buffer = np.zeros((length, 3), dtype="uint8")
         self._window = window
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def buffer(self) -> np.ndarray:
+        return self._buffer
 
     def show(self) -> None:
+        self._render(self._buffer)
+
+    async def show_async(self, executor: Optional[Executor] = None) -> None:
+        # Render a snapshot, so the caller can start on the next frame
+        # while this one is being output.
+        # asyncio and the executor are only imported here, so plain
+        # LEDStrip users don't pay for them at import time.
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        pixels = self._buffer.copy()
+        if executor is None:
+            # One thread per strip keeps its frames in order while
+            # letting different strips render side by side.
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            executor = self._executor
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, self._render, pixels)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> LEDStrip:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _render(self, pixels: np.ndarray) -> None:
         self._window.clear()
-        for i, pixel in enumerate(self._buffer):
-            self._window.set_led(i, pixel)
+        self._window.set_leds(pixels)
         self._window.show()
 
     def __iter__(self) -> Iterator[_LEDRef]:
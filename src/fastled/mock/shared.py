@@ -0,0 +1,166 @@
+"""Shared-memory LED strips
+
+The shared segment starts with a small header followed by a single frame:
+
+    [ sequence: uint64 | length: uint64 | frame: uint8[length][3] ]
+
+The owner draws into a private buffer, as with LEDStrip, and show()
+publishes it with a seqlock: the sequence is odd while the frame is being
+copied in and even once it is complete. Readers copy the frame out and
+retry if the sequence changed underneath them, so neither side blocks.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+from .led import LEDStrip
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .display import LEDWindow
+
+_HEADER_SIZE = 2 * np.dtype("uint64").itemsize
+_SEQUENCE = 0
+_LENGTH = 1
+
+# Attaching registers the segment with the resource tracker, which
+# unlinks whatever is still registered when it shuts down. Python 3.13+
+# can skip the registration; older versions have to undo it after
+# attaching, but only with a tracker this process started itself. Readers
+# started by multiprocessing share the creator's tracker, where the entry
+# is the creator's own.
+_ATTACH_KWARGS = {"track": False} if sys.version_info >= (3, 13) else {}
+_TRACK_ATTACHED = not _ATTACH_KWARGS and os.name == "posix"
+
+# Segments created by this process, whose registration belongs to the
+# creator and must be left in place when attaching to them here.
+_CREATED = set()
+
+
+def _owns_tracker() -> bool:
+    # A tracker we started is our child process. Spawned children inherit
+    # only the parent's tracker pipe, and forked ones its pid.
+    pid = resource_tracker._resource_tracker._pid
+    if pid is None:
+        return False
+    try:
+        os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        return False
+    return True
+
+
+class SharedLEDStrip(LEDStrip):
+
+    def __init__(
+            self,
+            memory: shared_memory.SharedMemory,
+            window: Optional[LEDWindow] = None,
+            owner: bool = False) -> None:
+        self._memory = memory
+        self._owner = owner
+        self._header = np.ndarray(
+            (2,), dtype="uint64", buffer=memory.buf)
+        length = int(self._header[_LENGTH])
+        self._shared = np.ndarray(
+            (length, 3), dtype="uint8", buffer=memory.buf,
+            offset=_HEADER_SIZE)
+        super().__init__(length, window)
+        self._sequence = 0
+
+    @classmethod
+    def create(
+            cls,
+            length: int,
+            window: Optional[LEDWindow] = None,
+            name: Optional[str] = None) -> SharedLEDStrip:
+        memory = shared_memory.SharedMemory(
+            name=name, create=True, size=_HEADER_SIZE + (length * 3))
+        header = np.ndarray((2,), dtype="uint64", buffer=memory.buf)
+        header[_SEQUENCE] = 0
+        header[_LENGTH] = length
+        _CREATED.add(memory._name)
+        return cls(memory, window, owner=True)
+
+    @classmethod
+    def attach(
+            cls,
+            name: str,
+            window: Optional[LEDWindow] = None) -> SharedLEDStrip:
+        memory = shared_memory.SharedMemory(name=name, **_ATTACH_KWARGS)
+        if (_TRACK_ATTACHED and memory._name not in _CREATED
+                and _owns_tracker()):
+            resource_tracker.unregister(memory._name, "shared_memory")
+        return cls(memory, window)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def frame_count(self) -> int:
+        return self._sequence // 2
+
+    def publish(self) -> None:
+        if not self._owner:
+            raise PermissionError(
+                f"Only the creator of '{self.name}' can publish frames.")
+        sequence = int(self._header[_SEQUENCE])
+        self._header[_SEQUENCE] = sequence + 1
+        np.copyto(self._shared, self._buffer)
+        self._header[_SEQUENCE] = sequence + 2
+        self._sequence = sequence + 2
+
+    def receive(
+            self,
+            timeout: Optional[float] = 0,
+            poll_interval: float = 0.001) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            sequence = int(self._header[_SEQUENCE])
+            if not sequence % 2 and sequence != self._sequence:
+                np.copyto(self._buffer, self._shared)
+                if int(self._header[_SEQUENCE]) == sequence:
+                    self._sequence = sequence
+                    return True
+                continue
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+
+    def show(self) -> None:
+        if self._owner:
+            self.publish()
+        if self._window is not None:
+            super().show()
+
+    async def show_async(self, executor: Optional[Executor] = None) -> None:
+        if self._owner:
+            self.publish()
+        if self._window is not None:
+            await super().show_async(executor)
+
+    def close(self) -> None:
+        super().close()
+        # Drop our views so the underlying mmap can be released.
+        self._header = self._shared = None
+        self._memory.close()
+
+    def unlink(self) -> None:
+        self._memory.unlink()
+        _CREATED.discard(self._memory._name)
+
+    def __enter__(self) -> SharedLEDStrip:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
@@ -1,6 +1,12 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from functools import cached_property
+
+from typing import TYPE_CHECKING, Tuple
 
-from typing import Tuple
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class PixelMap(ABC):
@@ -21,6 +27,38 @@ class PixelMap(ABC):
     def _hmax(self) -> int:
         return self._height - 1
 
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @cached_property
+    def coordinate_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(x, y) arrays holding the coordinates of every LED index."""
+        import numpy as np
+
+        coordinates = [
+            self.get_coordinates(i) for i in range(self._width * self._height)
+        ]
+        x, y = np.array(coordinates, dtype="intp").reshape(-1, 2).T
+        x.flags.writeable = y.flags.writeable = False
+        return x, y
+
+    @cached_property
+    def index_table(self) -> np.ndarray:
+        """(height, width) array holding the LED index at every (x, y)."""
+        import numpy as np
+
+        table = np.array([
+            [self.get_index(x, y) for x in range(self._width)]
+            for y in range(self._height)
+        ], dtype="intp").reshape(self._height, self._width)
+        table.flags.writeable = False
+        return table
+
     @abstractmethod
     def get_coordinates(self, i: int) -> Tuple[int, int]:
         raise NotImplementedError(
@@ -287,7 +325,8 @@ class BottomRightZigzagRows(PixelMap):
         return x, y
 
     def get_index(self, x: int, y: int) -> int:
-        x_comp = self._wmax - x if y % 2 else x
+        right_to_left = (y % 2) if self._hmax % 2 else (not y % 2)
+        x_comp = self._wmax - x if right_to_left else x
         y_comp = (self._hmax - y) * self._width
         return x_comp + y_comp
 
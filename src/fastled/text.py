@@ -0,0 +1,166 @@
+"""Bitmap text and sprites
+
+Fonts are kept as a glyph atlas, a (glyphs, height, width) boolean array
+built once per font. A message is composed into one wide bitmap up front,
+so each frame of a scrolling ticker is a slice of that bitmap blitted
+through the layout's index table.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+from .crgb import CRGB
+from .draw import Canvas, Colour, as_pixel
+
+# A 3x5 font small enough for 6-row matrices. Each glyph is five rows,
+# top to bottom, with each row written as an octal digit: 0o5 is "o o".
+_FONT_3X5 = {
+    " ": "00000", "!": "22202", "'": "22000", "(": "12221",
+    ")": "42224", "+": "02720", ",": "00024", "-": "00700",
+    ".": "00002", "/": "11244", ":": "02020", "=": "07070",
+    "?": "61202",
+    "0": "75557", "1": "26227", "2": "71747", "3": "71317",
+    "4": "55711", "5": "74717", "6": "74757", "7": "71122",
+    "8": "75757", "9": "75717",
+    "A": "25755", "B": "65656", "C": "34443", "D": "65556",
+    "E": "74647", "F": "74644", "G": "34553", "H": "55755",
+    "I": "72227", "J": "11152", "K": "55655", "L": "44447",
+    "M": "57755", "N": "65555", "O": "25552", "P": "65644",
+    "Q": "25563", "R": "65655", "S": "34216", "T": "72222",
+    "U": "55557", "V": "55552", "W": "55775", "X": "55255",
+    "Y": "55222", "Z": "71247",
+}
+
+
+class BitmapFont:
+
+    def __init__(
+            self,
+            atlas: np.ndarray,
+            charset: str,
+            spacing: int = 1,
+            fallback: str = "?") -> None:
+        self._atlas = np.asarray(atlas, dtype="bool")
+        self._atlas.flags.writeable = False
+        self._lookup: Dict[str, int] = {
+            char: i for i, char in enumerate(charset)
+        }
+        self._spacing = spacing
+        self._fallback = self._lookup[fallback]
+
+    @classmethod
+    def from_octal_rows(
+            cls,
+            glyphs: Dict[str, str],
+            width: int = 3,
+            **kwargs: int) -> BitmapFont:
+        rows = np.array(
+            [[int(row, 8) for row in glyph] for glyph in glyphs.values()])
+        bits = 1 << np.arange(width - 1, -1, -1)
+        atlas = (rows[..., np.newaxis] & bits) > 0
+        return cls(atlas, "".join(glyphs), **kwargs)
+
+    @property
+    def height(self) -> int:
+        return self._atlas.shape[1]
+
+    def glyph(self, char: str) -> np.ndarray:
+        return self._atlas[self._index(char)]
+
+    def render(self, message: str) -> np.ndarray:
+        """Compose a message into one (height, width) boolean bitmap."""
+        indices = np.array([self._index(char) for char in message],
+                           dtype="intp")
+        glyphs = self._atlas[indices]
+        glyphs = np.pad(glyphs, ((0, 0), (0, 0), (0, self._spacing)))
+        # (chars, height, width) -> (height, chars * width)
+        bitmap = glyphs.transpose(1, 0, 2).reshape(self.height, -1)
+        if self._spacing:
+            bitmap = bitmap[:, :-self._spacing]
+        return bitmap
+
+    def _index(self, char: str) -> int:
+        index = self._lookup.get(char)
+        if index is None:
+            index = self._lookup.get(char.upper(), self._fallback)
+        return index
+
+
+@lru_cache(maxsize=None)
+def default_font() -> BitmapFont:
+    return BitmapFont.from_octal_rows(_FONT_3X5)
+
+
+class Sprite:
+
+    def __init__(
+            self,
+            pixels: np.ndarray,
+            mask: Optional[np.ndarray] = None) -> None:
+        self.pixels = np.asarray(pixels, dtype="uint8")
+        self.mask = None if mask is None else np.asarray(mask, dtype="bool")
+
+    @classmethod
+    def from_bitmap(cls, bitmap: np.ndarray, colour: Colour) -> Sprite:
+        bitmap = np.asarray(bitmap, dtype="bool")
+        pixels = np.zeros(bitmap.shape + (3,), dtype="uint8")
+        pixels[bitmap] = as_pixel(colour)
+        return cls(pixels, bitmap)
+
+    def draw(self, canvas: Canvas, x: int = 0, y: int = 0) -> None:
+        canvas.blit(self.pixels, x, y, self.mask)
+
+
+class ScrollingText:
+    """A message that scrolls right to left across the layout.
+
+    The composed bitmap is padded with a blank screen on either side, so
+    the text scrolls in from the right edge and out past the left one.
+    """
+
+    def __init__(
+            self,
+            canvas: Canvas,
+            message: str,
+            colour: Colour = CRGB(0xFFFFFF),
+            background: Optional[Colour] = CRGB(0x000000),
+            font: Optional[BitmapFont] = None,
+            y: int = 0) -> None:
+        self._canvas = canvas
+        self._font = font or default_font()
+        self._y = y
+        self._width = canvas.layout.width
+        text = self._font.render(message)
+        self._bitmap = np.pad(text, ((0, 0), (self._width, self._width)))
+        self._transparent = background is None
+        if background is None:
+            background = CRGB(0x000000)
+        self._palette = np.stack(
+            [as_pixel(background), as_pixel(colour)])
+
+    @property
+    def frame_count(self) -> int:
+        return self._bitmap.shape[1] - self._width + 1
+
+    def window(self, offset: int) -> np.ndarray:
+        """The visible part of the bitmap, as a view into it."""
+        offset %= self.frame_count
+        return self._bitmap[:, offset:offset + self._width]
+
+    def draw(self, offset: int) -> None:
+        window = self.window(offset)
+        image = self._palette[window.view("uint8")]
+        mask = window if self._transparent else None
+        self._canvas.blit(image, 0, self._y, mask)
+
+    def frames(self, loop: bool = False) -> Iterator[int]:
+        """Draw each scroll position in turn, yielding its offset."""
+        while True:
+            for offset in range(self.frame_count):
+                self.draw(offset)
+                yield offset
+            if not loop:
+                return
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from fastled import CRGB, Colours
+from fastled.mock import HeadlessWindow, LEDStrip, SharedLEDStrip
+from fastled.mock.aio import FrameClock, show_all
+
+
+class BarrierWindow(HeadlessWindow):
+
+    def __init__(self, barrier: threading.Barrier) -> None:
+        super().__init__(2, 1)
+        self._barrier = barrier
+        self.thread = None
+
+    def show(self) -> None:
+        # Only passes once every strip is showing at the same time.
+        self._barrier.wait()
+        self.thread = threading.get_ident()
+        super().show()
+
+
+class FakeTime:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestShowAsync(IsolatedAsyncioTestCase):
+
+    async def test_shows_snapshot(self) -> None:
+        window = HeadlessWindow(2, 1)
+        with LEDStrip(2, window) as strip:
+            strip[0] = CRGB(Colours.WHITE)
+
+            pending = asyncio.ensure_future(strip.show_async())
+            await asyncio.sleep(0)
+            strip[0] = CRGB(Colours.BLACK)
+            await pending
+
+        np.testing.assert_array_equal(255, window.frames[0][0, 0])
+
+    async def test_show_all_runs_concurrently(self) -> None:
+        barrier = threading.Barrier(4, timeout=10)
+        windows = [BarrierWindow(barrier) for _ in range(4)]
+        strips = [LEDStrip(2, window) for window in windows]
+
+        await show_all(*strips)
+
+        self.assertEqual(4, len({window.thread for window in windows}))
+        for strip in strips:
+            strip.close()
+
+    async def test_shared_strip_publishes(self) -> None:
+        with SharedLEDStrip.create(2) as producer:
+            consumer = SharedLEDStrip.attach(producer.name)
+            producer[1] = CRGB(Colours.BLUE)
+            await producer.show_async()
+
+            self.assertTrue(consumer.receive())
+            np.testing.assert_array_equal(
+                producer.buffer, consumer.buffer)
+            consumer.close()
+
+
+class TestClose(TestCase):
+
+    def test_close_stops_executor(self) -> None:
+        strip = LEDStrip(2, HeadlessWindow(2, 1))
+        asyncio.run(strip.show_async())
+        executor = strip._executor
+
+        strip.close()
+
+        self.assertIsNone(strip._executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+
+
+@patch("asyncio.sleep", new_callable=AsyncMock)
+class TestFrameClock(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.time = FakeTime()
+        self.clock = FrameClock(fps=100, clock=self.time)
+
+    async def test_schedules_from_start(self, sleep: AsyncMock) -> None:
+        self.assertEqual(0, await self.clock.tick())
+
+        self.time.now = 0.004
+        self.assertEqual(1, await self.clock.tick())
+        self.assertAlmostEqual(0.006, sleep.await_args.args[0])
+
+        # A slow frame that still finishes in time doesn't shift the
+        # deadlines that follow.
+        self.time.now = 0.019
+        self.assertEqual(2, await self.clock.tick())
+        self.assertAlmostEqual(0.001, sleep.await_args.args[0])
+        self.assertEqual(0, self.clock.dropped)
+
+    async def test_skips_missed_frames(self, sleep: AsyncMock) -> None:
+        await self.clock.tick()
+
+        self.time.now = 0.055
+        self.assertEqual(5, await self.clock.tick())
+        self.assertEqual(4, self.clock.dropped)
+        self.assertEqual(0.0, sleep.await_args.args[0])
+
+    async def test_async_iteration(self, sleep: AsyncMock) -> None:
+        frames = []
+        async for frame in self.clock:
+            frames.append(frame)
+            self.time.now += 0.01
+            if len(frames) == 3:
+                break
+        self.assertEqual([0, 1, 2], frames)
+        self.assertEqual(0, self.clock.dropped)
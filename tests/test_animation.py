@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+import numpy as np
+
+from fastled import pixel_map
+from fastled.animation import AnimationPlayer, evaluate, to_strip_order
+from fastled.mock import HeadlessWindow, LEDStrip
+
+
+def gradient(t: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    # Blue follows the frame, green the column and red the row.
+    return np.stack(np.broadcast_arrays(t * 10, x, y), axis=-1)
+
+
+class TestAnimation(TestCase):
+
+    def setUp(self) -> None:
+        self.layout = pixel_map.BottomLeftZigzagRows(3, 2)
+
+    def test_evaluate(self) -> None:
+        block = evaluate(gradient, self.layout, np.array([0.0, 0.5]))
+
+        self.assertEqual((2, 2, 3, 3), block.shape)
+        self.assertEqual("uint8", block.dtype)
+        np.testing.assert_array_equal([5, 2, 1], block[1, 1, 2])
+
+    def test_evaluate_broadcasts(self) -> None:
+        block = evaluate(lambda t, x, y: 300, self.layout, np.zeros(3))
+        np.testing.assert_array_equal(np.full((3, 2, 3, 3), 255), block)
+
+    def test_to_strip_order(self) -> None:
+        block = evaluate(gradient, self.layout, np.zeros(1))
+        frames = to_strip_order(block, self.layout)
+
+        for i in range(6):
+            x, y = self.layout.get_coordinates(i)
+            np.testing.assert_array_equal([0, x, y], frames[0, i])
+
+    def test_play(self) -> None:
+        window = HeadlessWindow(3, 2, pixel_map.BottomLeftZigzagRows)
+        player = AnimationPlayer(
+            LEDStrip(6, window), self.layout, gradient,
+            fps=10, block_seconds=0.2)
+
+        shown = player.play(duration=0.5, realtime=False)
+
+        self.assertEqual(5, shown)
+        expected = evaluate(gradient, self.layout, np.arange(5) / 10)
+        np.testing.assert_array_equal(expected, np.stack(window.frames))
@@ -0,0 +1,112 @@
+import json
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+
+from fastled import CRGB, Colours, pixel_map
+from fastled.mock import LEDStrip
+from fastled.mock.batch import RenderJob, main, render, render_batch
+
+
+def chase(leds: LEDStrip, layout: pixel_map.PixelMap, frame: int) -> None:
+    leds[frame % (layout.width * layout.height)] = CRGB(Colours.WHITE)
+
+
+def broken(leds: LEDStrip, layout: pixel_map.PixelMap, frame: int) -> None:
+    raise RuntimeError(f"broken at frame {frame}")
+
+
+class TestBatch(TestCase):
+
+    def test_render_follows_layout(self) -> None:
+        job = RenderJob(chase, pixel_map.BottomLeftZigzagRows, 3, 2, 4)
+        frames = render(job)
+
+        self.assertEqual((4, 2, 3, 3), frames.shape)
+        # The fourth LED wraps around to the right end of the top row.
+        lit = np.argwhere(frames[3].any(axis=-1)).tolist()
+        self.assertEqual([[0, 2], [1, 0], [1, 1], [1, 2]], lit)
+
+    def test_render_effect_reference(self) -> None:
+        job = RenderJob(f"{__name__}:chase", "TopLeftProgressiveRows", 2, 2, 1)
+        np.testing.assert_array_equal(
+            [[[255] * 3, [0] * 3], [[0] * 3, [0] * 3]], render(job)[0])
+
+    def test_render_batch(self) -> None:
+        jobs = [
+            RenderJob(chase, map_type, 4, 4, 8, name=map_type.__name__)
+            for map_type in (pixel_map.TopLeftProgressiveRows,
+                             pixel_map.TopRightZigzagColumns)
+        ]
+        with TemporaryDirectory() as output_dir:
+            results = render_batch(jobs, output_dir, processes=2)
+
+            self.assertEqual([job.name for job in jobs],
+                             [result.name for result in results])
+            for job, result in zip(jobs, results):
+                self.assertEqual(Path(output_dir, f"{job.name}.npy"),
+                                 result.path)
+                np.testing.assert_array_equal(
+                    render(job), np.load(result.path))
+
+    def test_default_names_include_frames(self) -> None:
+        jobs = [
+            RenderJob(chase, pixel_map.TopLeftProgressiveRows, 2, 2, frames)
+            for frames in (5, 10)
+        ]
+        with TemporaryDirectory() as output_dir:
+            results = render_batch(jobs, output_dir, processes=2)
+            self.assertEqual([5, 10], [len(np.load(result.path))
+                                       for result in results])
+
+    def test_rejects_duplicate_names(self) -> None:
+        job = RenderJob(chase, pixel_map.TopLeftProgressiveRows, 2, 2, 1)
+        with TemporaryDirectory() as output_dir:
+            with self.assertRaisesRegex(ValueError, "overwrite"):
+                render_batch([job, job], output_dir)
+
+    def test_failed_job_keeps_others(self) -> None:
+        jobs = [
+            RenderJob(chase, pixel_map.TopLeftProgressiveRows, 2, 2, 3,
+                      name="good"),
+            RenderJob(broken, pixel_map.TopLeftProgressiveRows, 2, 2, 3,
+                      name="bad"),
+        ]
+        with TemporaryDirectory() as output_dir:
+            good, bad = render_batch(jobs, output_dir, processes=2)
+
+            self.assertTrue(good.ok)
+            self.assertEqual(3, len(np.load(good.path)))
+            self.assertFalse(bad.ok)
+            self.assertIsNone(bad.path)
+            self.assertEqual("RuntimeError: broken at frame 0", bad.error)
+            self.assertFalse(Path(output_dir, "bad.npy").exists())
+
+    def test_main_reports_each_job(self) -> None:
+        jobs = [
+            {"effect": f"{__name__}:chase", "name": "good",
+             "map_type": "TopLeftProgressiveRows",
+             "width": 2, "height": 2, "frames": 3},
+            {"effect": f"{__name__}:broken", "name": "bad",
+             "map_type": "TopLeftProgressiveRows",
+             "width": 2, "height": 2, "frames": 3},
+        ]
+        with TemporaryDirectory() as output_dir:
+            jobs_path = Path(output_dir, "jobs.json")
+            jobs_path.write_text(json.dumps(jobs))
+            output = StringIO()
+            with redirect_stdout(output):
+                with self.assertRaises(SystemExit) as exit_info:
+                    main([str(jobs_path), "--output", output_dir,
+                          "--processes", "2"])
+
+        self.assertEqual(1, exit_info.exception.code)
+        lines = output.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith("OK   good: 3 frames"))
+        self.assertEqual("FAIL bad: RuntimeError: broken at frame 0",
+                         lines[1])
+        self.assertTrue(lines[2].startswith("Rendered 1 of 2 jobs"))
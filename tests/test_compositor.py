@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+import numpy as np
+from parameterized import parameterized
+
+from fastled import CRGB
+from fastled.compositor import BlendMode, Compositor
+from fastled.mock import HeadlessWindow, LEDStrip
+
+
+class TestCompositor(TestCase):
+
+    def setUp(self) -> None:
+        self.window = HeadlessWindow(2, 1)
+        self.strip = LEDStrip(2, self.window)
+        self.compositor = Compositor(self.strip)
+        self.background = self.compositor.add_layer("background")
+        self.background.fill(CRGB(0x808080))
+
+    @parameterized.expand([
+        (BlendMode.NORMAL, 0x404040),
+        (BlendMode.ADD, 0xC0C0C0),
+        (BlendMode.SCREEN, 0xA0A0A0),
+        (BlendMode.MULTIPLY, 0x202020),
+        (BlendMode.MAX, 0x808080),
+    ])
+    def test_blend_mode(self, blend: BlendMode, expected: int) -> None:
+        self.compositor.add_layer("top", blend=blend).fill(CRGB(0x404040))
+        self.compositor.flatten()
+        np.testing.assert_allclose(
+            [list(CRGB(expected))] * 2, self.strip.buffer, atol=1)
+
+    def test_opacity_and_mask(self) -> None:
+        top = self.compositor.add_layer(
+            "top", opacity=0.5, mask=np.array([255, 0], dtype="uint8"))
+        top.fill(CRGB(0xFFFFFF))
+        self.compositor.flatten()
+        np.testing.assert_allclose(
+            [[192] * 3, [128] * 3], self.strip.buffer, atol=1)
+
+    def test_hidden_layer(self) -> None:
+        self.compositor.add_layer("top", visible=False).fill(CRGB(0xFFFFFF))
+        self.compositor.flatten()
+        np.testing.assert_array_equal(128, self.strip.buffer)
+
+    def test_skips_unchanged_layers(self) -> None:
+        self.compositor.flatten()
+        self.assertFalse(self.compositor.flatten(),
+                         "Nothing should be flattened without changes")
+
+        self.compositor["background"][0] = CRGB(0x000000)
+        self.assertTrue(self.compositor.flatten())
+        np.testing.assert_array_equal([[0] * 3, [128] * 3],
+                                      self.strip.buffer)
+
+    def test_writes_through_kept_buffer(self) -> None:
+        buffer = self.background.buffer
+        buffer[:] = 10
+        self.compositor.flatten()
+        buffer[:] = 200
+
+        self.assertTrue(self.compositor.flatten(),
+                        "Writes through a kept buffer should be flattened")
+        np.testing.assert_array_equal(200, self.strip.buffer)
+
+    def test_remove_layer(self) -> None:
+        self.compositor.add_layer("top").fill(CRGB(0xFFFFFF))
+        self.compositor.flatten()
+        self.compositor.remove_layer("top")
+        self.compositor.flatten()
+        np.testing.assert_array_equal(128, self.strip.buffer)
+
+    def test_remove_unknown_layer(self) -> None:
+        with self.assertRaisesRegex(KeyError, "'missing' does not exist"):
+            self.compositor.remove_layer("missing")
+        self.assertEqual(1, len(self.compositor))
+
+    def test_show(self) -> None:
+        self.compositor.show()
+        np.testing.assert_array_equal(128, self.window.frames[-1])
@@ -0,0 +1,91 @@
+from typing import List, Tuple
+from unittest import TestCase
+
+import numpy as np
+from parameterized import parameterized
+
+from fastled import CRGB, Colours, draw, pixel_map
+from fastled.mock import HeadlessWindow, LEDStrip
+
+
+def _points(x: np.ndarray, y: np.ndarray) -> List[Tuple[int, int]]:
+    return sorted(zip(x.tolist(), y.tolist()))
+
+
+class TestShapes(TestCase):
+
+    @parameterized.expand([
+        ((0, 0, 3, 0), [(0, 0), (1, 0), (2, 0), (3, 0)]),
+        ((0, 0, 2, 2), [(0, 0), (1, 1), (2, 2)]),
+        ((1, 1, 1, 1), [(1, 1)]),
+    ])
+    def test_line(self, ends: Tuple[int, ...], expected: list) -> None:
+        self.assertEqual(expected, _points(*draw.line(*ends)))
+
+    def test_rect(self) -> None:
+        self.assertEqual(9, len(draw.rect(0, 0, 3, 3)[0]))
+        self.assertNotIn((1, 1), _points(*draw.rect(0, 0, 3, 3, fill=False)))
+
+    def test_circle(self) -> None:
+        self.assertEqual([(0, -1), (-1, 0), (0, 0), (1, 0), (0, 1)],
+                         sorted(_points(*draw.circle(0, 0, 1)),
+                                key=lambda p: (p[1], p[0])))
+        self.assertNotIn((0, 0), _points(*draw.circle(0, 0, 2, fill=False)))
+
+    def test_as_pixel(self) -> None:
+        expected = list(CRGB(Colours.RED))
+        self.assertEqual(expected, draw.as_pixel(Colours.RED).tolist())
+        self.assertEqual(expected,
+                         draw.as_pixel(CRGB(Colours.RED)).tolist())
+
+    def test_polygon(self) -> None:
+        triangle = [(0, 0), (4, 0), (0, 4)]
+        filled = _points(*draw.polygon(triangle))
+        outline = _points(*draw.polygon(triangle, fill=False))
+
+        self.assertIn((1, 1), filled)
+        self.assertNotIn((1, 1), outline)
+        self.assertNotIn((3, 3), filled)
+        self.assertTrue(set(outline) <= set(filled))
+
+
+class TestCanvas(TestCase):
+
+    def setUp(self) -> None:
+        self.layout = pixel_map.BottomLeftZigzagRows(4, 3)
+        self.strip = LEDStrip(12, HeadlessWindow(4, 3))
+        self.canvas = draw.Canvas(self.strip, self.layout)
+
+    def test_line_uses_layout(self) -> None:
+        self.canvas.line(0, 0, 3, 0, CRGB(Colours.RED))
+
+        lit = np.flatnonzero(self.strip.buffer.any(axis=-1)).tolist()
+        self.assertEqual([8, 9, 10, 11], lit)
+        np.testing.assert_array_equal(list(CRGB(Colours.RED)),
+                                      self.strip.buffer[8])
+
+    def test_clips_to_layout(self) -> None:
+        self.canvas.rect(-2, -2, 10, 10, Colours.WHITE)
+        np.testing.assert_array_equal(255, self.strip.buffer)
+
+    def test_antialiased_points(self) -> None:
+        self.canvas.points([0.5], [0.0], Colours.WHITE)
+
+        index = self.layout.get_index
+        np.testing.assert_array_equal(128, self.strip.buffer[index(0, 0)])
+        np.testing.assert_array_equal(128, self.strip.buffer[index(1, 0)])
+        self.assertEqual(256 * 3, int(self.strip.buffer.sum()))
+
+    def test_short_strip(self) -> None:
+        strip = LEDStrip(5, HeadlessWindow(4, 3))
+        canvas = draw.Canvas(strip, self.layout)
+
+        canvas.rect(0, 0, 4, 3, Colours.WHITE)
+        np.testing.assert_array_equal(255, strip.buffer)
+
+        canvas.blit(np.zeros((3, 4, 3), dtype="uint8"),
+                    mask=np.ones((3, 4), dtype=bool))
+        np.testing.assert_array_equal(0, strip.buffer)
+
+        canvas.points([0.5, 1.5], [0.0, 2.0], Colours.WHITE)
+        self.assertEqual(256 * 3, int(strip.buffer.sum()))
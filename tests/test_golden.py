@@ -0,0 +1,58 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+
+from fastled import CRGB, pixel_map
+from fastled.mock import LEDStrip
+from fastled.mock.golden import check_golden, compare, frame_digest
+
+
+def chase(leds: LEDStrip, layout: pixel_map.PixelMap, frame: int) -> None:
+    leds[frame % 6] = CRGB(0x102030 * (frame + 1))
+
+
+def chase_with_glitch(
+        leds: LEDStrip, layout: pixel_map.PixelMap, frame: int) -> None:
+    chase(leds, layout, frame)
+    if frame == 3:
+        leds[4] = CRGB(0xFFFFFF)
+
+
+class TestGolden(TestCase):
+
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name, "golden", "chase.npz")
+        self.layout = pixel_map.BottomLeftZigzagRows(3, 2)
+        check_golden(chase, self.layout, 8, self.path)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_frame_digest(self) -> None:
+        buffer = np.zeros((6, 3), dtype="uint8")
+        digest = frame_digest(buffer)
+        buffer[5, 2] = 1
+        self.assertNotEqual(digest, frame_digest(buffer))
+
+    def test_matches(self) -> None:
+        self.assertTrue(self.path.exists(), "Golden file should be written")
+        self.assertIsNone(compare(chase, self.layout, 8, self.path))
+
+    def test_reports_first_difference(self) -> None:
+        mismatch = compare(chase_with_glitch, self.layout, 8, self.path)
+
+        self.assertEqual(3, mismatch.frame)
+        self.assertEqual(4, mismatch.index)
+        self.assertEqual((1, 0), mismatch.coordinates)
+        np.testing.assert_array_equal(255, mismatch.actual)
+        with self.assertRaisesRegex(AssertionError, "Frame 3 .* LED 4"):
+            check_golden(chase_with_glitch, self.layout, 8, self.path)
+
+    def test_update(self) -> None:
+        check_golden(chase_with_glitch, self.layout, 8, self.path,
+                     update=True)
+        self.assertIsNone(
+            compare(chase_with_glitch, self.layout, 8, self.path))
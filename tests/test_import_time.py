@@ -0,0 +1,58 @@
+import subprocess
+import sys
+from typing import Dict
+from unittest import TestCase
+
+from parameterized import parameterized
+
+# Budget in microseconds. Most of it is spent on typing and enum; loading
+# numpy or OpenCV would blow it several times over.
+IMPORT_BUDGET_US = 50_000
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, found, fields = line.partition("import time:")
+        if not found:
+            continue
+        _, cumulative, name = fields.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime(TestCase):
+
+    @parameterized.expand([
+        ("fastled",),
+        ("fastled.pixel_map",),
+    ])
+    def test_import_budget(self, module: str) -> None:
+        cumulative = _import_times(module)[module]
+        self.assertLess(cumulative, IMPORT_BUDGET_US,
+                        f"Importing {module} should take only milliseconds")
+
+    @parameterized.expand([
+        ("fastled",),
+        ("fastled.pixel_map",),
+        ("fastled.mock",),
+        ("fastled.mock.batch",),
+    ])
+    def test_opencv_not_imported(self, module: str) -> None:
+        times = _import_times(module)
+        self.assertNotIn("cv2", times,
+                         f"Importing {module} should not load OpenCV")
+
+    def test_opencv_imported_for_window(self) -> None:
+        times = _import_times("fastled.mock.display")
+        self.assertIn("cv2", times)
+
+    def test_asyncio_not_imported(self) -> None:
+        times = _import_times("fastled.mock")
+        self.assertNotIn("asyncio", times,
+                         "asyncio should only load for show_async()")
@@ -0,0 +1,100 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterator
+from unittest import TestCase
+
+import numpy as np
+
+from fastled import ingest, pixel_map
+from fastled.mock import HeadlessWindow, LEDStrip
+
+
+class TestDownsample(TestCase):
+
+    def test_area_average(self) -> None:
+        frame = np.zeros((4, 6, 3), dtype="uint8")
+        frame[:2, :3] = 200
+        frame[0, 0] = 0
+
+        image = ingest.downsample(frame, 2, 2)
+
+        self.assertEqual((2, 2, 3), image.shape)
+        np.testing.assert_array_equal(167, image[0, 0])
+        np.testing.assert_array_equal(0, image[1])
+
+    def test_upsample_repeats_pixels(self) -> None:
+        frame = np.array([[10, 20]], dtype="uint8")
+        image = ingest.downsample(frame, 4, 2)
+        np.testing.assert_array_equal(
+            [[10, 10, 20, 20]] * 2, image[..., 0])
+
+    def test_sample(self) -> None:
+        frame = np.arange(12, dtype="uint8").reshape(3, 4)
+        pixels = ingest.sample(frame, [0.0, 1.0, 0.5], [0.0, 1.0, 0.5])
+        np.testing.assert_array_equal([0, 11, 6], pixels[:, 0])
+
+
+class TestIngest(TestCase):
+
+    def setUp(self) -> None:
+        self.layout = pixel_map.BottomLeftZigzagRows(3, 2)
+        self.window = HeadlessWindow(3, 2, pixel_map.BottomLeftZigzagRows)
+        self.strip = LEDStrip(6, self.window)
+
+    def test_ingest_follows_layout(self) -> None:
+        frames = [np.full((20, 30, 3), value, dtype="uint8")
+                  for value in (0, 100)]
+        frames[1][:10, 20:] = 250
+
+        for _ in ingest.ingest(frames, self.strip, self.layout):
+            self.strip.show()
+
+        self.assertEqual(2, len(self.window.frames))
+        np.testing.assert_array_equal(
+            [[100, 100, 250], [100, 100, 100]],
+            self.window.frames[1][..., 0])
+
+    def test_ingest_samples_coordinates(self) -> None:
+        frame = np.zeros((11, 11, 3), dtype="uint8")
+        frame[0, 0] = 10
+        frame[5, 5] = 20
+        frame[10, 10] = 30
+        coordinates = ([0.0, 0.5, 1.0, 1.0], [0.0, 0.5, 1.0, 0.0])
+
+        list(ingest.ingest([frame], self.strip, self.layout,
+                           coordinates=coordinates))
+
+        np.testing.assert_array_equal(
+            [10, 20, 30, 0, 0, 0], self.strip.buffer[:, 0])
+
+    def test_image_frames(self) -> None:
+        import cv2
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory, "frame.png")
+            cv2.imwrite(str(path), np.full((4, 6, 3), 42, dtype="uint8"))
+            frames = list(ingest.image_frames([path]))
+
+        self.assertEqual((4, 6, 3), frames[0].shape)
+        with self.assertRaises(FileNotFoundError):
+            next(ingest.image_frames(["missing.png"]))
+
+
+class TestPrefetch(TestCase):
+
+    def test_keeps_order(self) -> None:
+        self.assertEqual(list(range(20)),
+                         list(ingest.prefetch(range(20), depth=2)))
+
+    def test_reraises_errors(self) -> None:
+        def frames() -> Iterator[int]:
+            yield 1
+            raise ValueError("bad frame")
+
+        with self.assertRaises(ValueError):
+            list(ingest.prefetch(frames()))
+
+    def test_stops_early(self) -> None:
+        frames = ingest.prefetch(iter(range(1000)), depth=1)
+        self.assertEqual(0, next(frames))
+        frames.close()
@@ -1,5 +1,8 @@
-from typing import Tuple, Type
+from itertools import product
+from typing import List, Tuple, Type
 from unittest import TestCase
+
+import numpy as np
 from parameterized import parameterized_class
 
 from fastled import pixel_map
@@ -220,3 +223,31 @@ class TestPixelMap(TestCase):
         expected = self.expected_index
         actual = self._map.get_index(*self.expected_coordinates)
         self.assertEqual(expected, actual, f"Index should match {expected}")
+
+
+def _all_map_types() -> List[Type[pixel_map.PixelMap]]:
+    return [
+        value for value in vars(pixel_map).values()
+        if isinstance(value, type)
+        and issubclass(value, pixel_map.PixelMap)
+        and value is not pixel_map.PixelMap
+    ]
+
+
+@parameterized_class(
+    [{"map_type": map_type} for map_type in _all_map_types()],
+    class_name_func=_get_class_name)
+class TestPixelMapInverse(TestCase):
+    map_type: Type[pixel_map.PixelMap]
+
+    def test_index_and_coordinates_are_inverses(self) -> None:
+        for width, height in product(range(1, 17), repeat=2):
+            layout = self.map_type(width, height)
+            x, y = layout.coordinate_table
+            message = f"{width}x{height}"
+
+            self.assertTrue(((x >= 0) & (x < width)).all(), message)
+            self.assertTrue(((y >= 0) & (y < height)).all(), message)
+            np.testing.assert_array_equal(
+                np.arange(width * height), layout.index_table[y, x],
+                err_msg=message)
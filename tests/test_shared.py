@@ -0,0 +1,116 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+
+from fastled import CRGB, Colours
+from fastled.mock import SharedLEDStrip
+
+
+# Runs as its own program, so the resource tracker's output (it shares
+# the program's stderr) can be checked.
+_PRODUCER = """
+from multiprocessing import get_context
+
+from fastled import CRGB, Colours
+from fastled.mock import SharedLEDStrip
+
+
+def consume(name):
+    strip = SharedLEDStrip.attach(name)
+    received = strip.receive(timeout=10)
+    ok = received and strip.buffer[0].tolist() == list(CRGB(Colours.RED))
+    strip.close()
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    with SharedLEDStrip.create(4) as producer:
+        # Spawn last: attaching registers the segment again, which would
+        # hide an earlier reader dropping the producer's registration.
+        for method in ("fork", "spawn"):
+            reader = get_context(method).Process(
+                target=consume, args=(producer.name,))
+            reader.start()
+            producer[0] = CRGB(Colours.RED)
+            producer.show()
+            reader.join(timeout=30)
+            assert reader.exitcode == 0, method
+"""
+
+
+class TestSharedLEDStrip(TestCase):
+
+    def setUp(self) -> None:
+        self.producer = SharedLEDStrip.create(4)
+        self.consumer = SharedLEDStrip.attach(self.producer.name)
+
+    def tearDown(self) -> None:
+        self.consumer.close()
+        self.producer.close()
+        self.producer.unlink()
+
+    def test_receive_without_frame(self) -> None:
+        self.assertFalse(self.consumer.receive(),
+                         "Nothing should be received before show()")
+
+    def test_receive_published_frame(self) -> None:
+        self.producer[1] = CRGB(Colours.GREEN)
+        self.producer.show()
+
+        self.assertTrue(self.consumer.receive())
+        np.testing.assert_array_equal(
+            self.producer.buffer, self.consumer.buffer)
+        self.assertEqual(1, self.consumer.frame_count)
+
+    def test_receive_only_new_frames(self) -> None:
+        self.producer.show()
+        self.consumer.receive()
+        self.assertFalse(self.consumer.receive(),
+                         "A frame should only be received once")
+
+    def test_unpublished_changes_are_private(self) -> None:
+        self.producer.show()
+        self.producer[0] = CRGB(Colours.WHITE)
+
+        self.consumer.receive()
+        np.testing.assert_array_equal(0, self.consumer.buffer)
+
+    def test_consumer_cannot_publish(self) -> None:
+        with self.assertRaises(PermissionError):
+            self.consumer.publish()
+
+    def test_cross_process(self) -> None:
+        with TemporaryDirectory() as directory:
+            script = Path(directory, "producer.py")
+            script.write_text(_PRODUCER)
+            result = subprocess.run([sys.executable, str(script)],
+                                    capture_output=True, text=True)
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        # Tracker complaints, such as a reader unregistering the
+        # producer's segment, would show up here.
+        self.assertEqual("", result.stderr)
+
+    def test_independent_reader_keeps_segment(self) -> None:
+        self.producer[0] = CRGB(Colours.RED)
+        self.producer.show()
+        reader = (
+            "from fastled.mock import SharedLEDStrip\n"
+            f"strip = SharedLEDStrip.attach({self.producer.name!r})\n"
+            "assert strip.receive(timeout=10)\n"
+            "strip.close()\n"
+        )
+        subprocess.run([sys.executable, "-c", reader], check=True)
+
+        # The reader's resource tracker cleans up shortly after the reader
+        # exits, so keep checking that it leaves the segment alone.
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline:
+            again = SharedLEDStrip.attach(self.producer.name)
+            again.close()
+            time.sleep(0.05)
@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+import numpy as np
+
+from fastled import CRGB, Colours, pixel_map
+from fastled.draw import Canvas
+from fastled.mock import HeadlessWindow, LEDStrip
+from fastled.text import ScrollingText, Sprite, default_font
+
+
+class TestBitmapFont(TestCase):
+
+    def test_glyph(self) -> None:
+        np.testing.assert_array_equal(
+            [[0, 1, 0], [1, 0, 1], [1, 1, 1], [1, 0, 1], [1, 0, 1]],
+            default_font().glyph("A"))
+
+    def test_lowercase_and_fallback(self) -> None:
+        font = default_font()
+        np.testing.assert_array_equal(font.glyph("A"), font.glyph("a"))
+        np.testing.assert_array_equal(font.glyph("?"), font.glyph("~"))
+
+    def test_render(self) -> None:
+        font = default_font()
+        bitmap = font.render("HI")
+
+        self.assertEqual((5, 7), bitmap.shape)
+        np.testing.assert_array_equal(font.glyph("H"), bitmap[:, :3])
+        self.assertFalse(bitmap[:, 3].any(), "Glyphs should be spaced")
+        np.testing.assert_array_equal(font.glyph("I"), bitmap[:, 4:])
+
+
+class TestCanvasText(TestCase):
+
+    def setUp(self) -> None:
+        self.layout = pixel_map.BottomLeftZigzagRows(4, 6)
+        self.window = HeadlessWindow(4, 6, pixel_map.BottomLeftZigzagRows)
+        self.strip = LEDStrip(24, self.window)
+        self.canvas = Canvas(self.strip, self.layout)
+
+    def _frame(self) -> np.ndarray:
+        self.strip.show()
+        return self.window.frames[-1].any(axis=-1)
+
+    def test_sprite_is_clipped_and_masked(self) -> None:
+        self.strip.buffer[:] = 7
+        sprite = Sprite.from_bitmap([[1, 0], [1, 1]], CRGB(Colours.WHITE))
+        sprite.draw(self.canvas, x=3, y=-1)
+
+        np.testing.assert_array_equal(
+            255, self.strip.buffer[self.layout.get_index(3, 0)])
+        self.assertEqual(23 * 3 * 7 + 3 * 255, int(self.strip.buffer.sum()))
+
+    def test_scrolling_text(self) -> None:
+        ticker = ScrollingText(self.canvas, "I", y=1)
+        glyph = default_font().glyph("I")
+
+        self.assertEqual(8, ticker.frame_count)
+        ticker.draw(0)
+        self.assertFalse(self._frame().any(), "Text should start offscreen")
+
+        ticker.draw(4)
+        np.testing.assert_array_equal(glyph, self._frame()[1:, :3])
+
+        ticker.draw(7)
+        self.assertFalse(self._frame().any(), "Text should end offscreen")
+
+    def test_window_is_a_view(self) -> None:
+        ticker = ScrollingText(self.canvas, "HELLO")
+        self.assertIsNotNone(ticker.window(3).base)